@@ -11,7 +11,9 @@ class Config:
     
     # API Settings
     OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY")
-    OPENROUTER_API_URL = "https://openrouter.ai/api/v1/chat/completions"
+    OPENROUTER_API_URL = os.getenv(
+        "OPENROUTER_API_URL", "https://openrouter.ai/api/v1/chat/completions"
+    )
     
     # Model configurations - Using the latest flagship models (2025)
     MODELS = {
@@ -21,6 +23,10 @@ class Config:
         "qwen3-235b": "qwen/qwen3-235b-a22b"  # Qwen3 235B - large multilingual model
     }
     
+    # Models that need explicit cache_control hints to reuse the system prompt
+    # prefix (OpenAI and Qwen cache repeated prefixes automatically)
+    PROMPT_CACHE_MODELS = {"claude-sonnet-4", "claude-opus-4"}
+    
     # Translation settings
     TEMPERATURE = 0.3
     MAX_TOKENS = 1000
@@ -79,4 +79,11 @@ class TranslationService:
         print(f"Total rows: {total}")
         for model_key, count in successful.items():
             model_name = model_key.replace('_japanese', '')
-            print(f"{model_name}: {count}/{total} successful ({count/total*100:.1f}%)")
\ No newline at end of file
+            print(f"{model_name}: {count}/{total} successful ({count/total*100:.1f}%)")
+        
+        print("\nPrompt Cache Usage:")
+        for model_name, stats in self.translator.usage_stats.items():
+            prompt_tokens = stats["prompt_tokens"]
+            cached_tokens = stats["cached_tokens"]
+            cached_pct = cached_tokens / prompt_tokens * 100 if prompt_tokens else 0.0
+            print(f"{model_name}: {cached_tokens}/{prompt_tokens} prompt tokens cached ({cached_pct:.1f}%)")
\ No newline at end of file
@@ -3,7 +3,7 @@ import time
 import requests
 from typing import Dict, List, Optional
 from config import Config
-from prompts import MEDICAL_SAFETY_JAPANESE
+from prompts import MEDICAL_SAFETY_JAPANESE_SYSTEM, MEDICAL_SAFETY_JAPANESE_USER
 
 
 class MedicalTranslator:
@@ -22,6 +22,12 @@ class MedicalTranslator:
         self.session = requests.Session()
         self.session.headers.update(self.headers)
         
+        # Per-model token usage, including prompt tokens served from the provider cache
+        self.usage_stats = {
+            model_name: {"prompt_tokens": 0, "cached_tokens": 0}
+            for model_name in Config.MODELS
+        }
+        
     def translate_text(self, text: str, model_name: str) -> Optional[str]:
         """
         Translate text using specified model via OpenRouter API.
@@ -38,19 +44,12 @@ class MedicalTranslator:
             print(f"Unknown model: {model_name}")
             return None
         
-        # Use the same prompt for all models for consistency
-        prompt = MEDICAL_SAFETY_JAPANESE.format(text=text)
-            
         payload = {
             "model": model_id,
-            "messages": [
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
+            "messages": self._build_messages(text, model_name),
             "temperature": Config.TEMPERATURE,
-            "max_tokens": Config.MAX_TOKENS
+            "max_tokens": Config.MAX_TOKENS,
+            "usage": {"include": True}
         }
         
         try:
@@ -62,6 +61,7 @@ class MedicalTranslator:
             
             if response.status_code == 200:
                 result = response.json()
+                self._record_usage(model_name, result.get('usage'))
                 content = result['choices'][0]['message']['content'].strip()
                 
                 # Clean up any responses that might have extra formatting
@@ -84,6 +84,51 @@ class MedicalTranslator:
             print(f"Error translating with {model_name}: {str(e)}")
             return None
     
+    def _build_messages(self, text: str, model_name: str) -> List[Dict]:
+        """
+        Build the chat messages with a stable system prefix and per-item user suffix.
+        
+        Args:
+            text: The text to translate
+            model_name: The model the messages are built for
+            
+        Returns:
+            List of chat messages for the API payload
+        """
+        # Use the same prompt for all models for consistency
+        system_content = MEDICAL_SAFETY_JAPANESE_SYSTEM
+        if model_name in Config.PROMPT_CACHE_MODELS:
+            system_content = [
+                {
+                    "type": "text",
+                    "text": MEDICAL_SAFETY_JAPANESE_SYSTEM,
+                    "cache_control": {"type": "ephemeral"}
+                }
+            ]
+        
+        return [
+            {
+                "role": "system",
+                "content": system_content
+            },
+            {
+                "role": "user",
+                "content": MEDICAL_SAFETY_JAPANESE_USER.format(text=text)
+            }
+        ]
+    
+    def _record_usage(self, model_name: str, usage: Optional[Dict]):
+        """Accumulate prompt and cached token counts reported by the API."""
+        if not usage:
+            return
+        
+        stats = self.usage_stats.setdefault(
+            model_name, {"prompt_tokens": 0, "cached_tokens": 0}
+        )
+        details = usage.get('prompt_tokens_details') or {}
+        stats["prompt_tokens"] += usage.get('prompt_tokens') or 0
+        stats["cached_tokens"] += details.get('cached_tokens') or 0
+    
     def translate_with_all_models(self, text: str) -> Dict[str, str]:
         """
         Translate text with all configured models.